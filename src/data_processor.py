@@ -1,19 +1,270 @@
+import csv
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils import log_activity, timing_decorator
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # PyArrow is optional; fall back to the pandas C engine
+    pa = None
+    pc = None
+    pa_csv = None
+
+# Rows parsed per chunk; bounds the parsed data held at once during validation
+CHUNK_SIZE = 200_000
+
+# Bytes parsed per block when streaming with PyArrow
+ARROW_BLOCK_SIZE = 16 << 20
+
+# Accepted dtype hints, spelled for the (pandas, PyArrow) readers. pandas uses
+# nullable types so missing values behave as in Arrow. int64 is read as text
+# and parsed exactly by _parse_integers, which accepts values like "1.0" or
+# "1e3" as pandas does but, unlike pandas, never rounds through float64
+DTYPE_HINTS = {
+    'string': ('string', 'string'),
+    'int64': ('string', 'string'),
+    'float64': ('float64', 'float64'),
+}
+
+# Tokens read as missing by both readers; pandas' default NA set, spelled out
+# so both readers and pandas versions agree
+NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null',
+]
+
+# Integer strings as the pandas reader parses them
+_INT_PATTERN = r'\s*[+-]?\d+\s*'
+
+def _read_header(file_path: str) -> list:
+    """Return the column names from the first line of a CSV file"""
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+def _read_chunks(file_path: str, columns: Optional[List[str]], dtype_hints: Dict[str, str]):
+    """Yield a memory-mapped CSV file as DataFrame chunks, using PyArrow when available"""
+    if pa_csv is None:
+        yield from pd.read_csv(
+            file_path,
+            usecols=columns,
+            dtype={name: DTYPE_HINTS[hint][0] for name, hint in dtype_hints.items()},
+            na_values=NA_VALUES,
+            keep_default_na=False,
+            chunksize=CHUNK_SIZE,
+            low_memory=False,
+            memory_map=True,
+            engine='c',
+        )
+        return
+    
+    # Validation only inspects nullness, so read columns as strings unless
+    # hinted; this also keeps later blocks from failing type inference. IDs
+    # are compared by parsed value when hashed
+    column_types = {name: pa.string() for name in _read_header(file_path)}
+    column_types.update({name: DTYPE_HINTS[hint][1] for name, hint in dtype_hints.items()})
+    with pa.memory_map(file_path) as source, pa_csv.open_csv(
+        source,
+        read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            null_values=NA_VALUES,
+            strings_can_be_null=True,
+            include_columns=columns,
+        ),
+    ) as reader:
+        for batch in reader:
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+
+def _iter_chunks(
+    file_path: str,
+    columns: Optional[List[str]] = None,
+    dtype_hints: Optional[Dict[str, str]] = None,
+):
+    """Yield a CSV file as DataFrame chunks with the dtype hints applied"""
+    dtype_hints = dtype_hints or {}
+    int_columns = [name for name, hint in dtype_hints.items() if hint == 'int64']
+    for chunk in _read_chunks(file_path, columns, dtype_hints):
+        # Hints for columns that are not read are ignored, as pandas does
+        for name in int_columns:
+            if name in chunk.columns:
+                chunk[name] = _parse_integers(chunk[name])
+        yield chunk
+
+def _count_missing(chunk: pd.DataFrame) -> int:
+    """Count missing cells, reading Arrow null counts where available"""
+    missing = 0
+    for _, column in chunk.items():
+        if pa is not None and isinstance(column.dtype, pd.ArrowDtype):
+            # Null count is kept in the Arrow array metadata; no mask needed
+            missing += pa.array(column.array).null_count
+        else:
+            missing += np.count_nonzero(column.isna().to_numpy())
+    return int(missing)
+
+def _split_numbers(text: pd.Series) -> tuple:
+    """
+    Parse strings as numbers the way the pandas reader does
+
+    Integer strings are parsed exactly rather than through float64, and
+    integral floats such as "1.0" or "1e3" count as integers.
+
+    Returns:
+        (integer values as int64, the other values as float64 with NaN where
+        a string is not a number); both keep the index of ``text``
+    """
+    text = text.astype(object)
+    is_int = text.str.fullmatch(_INT_PATTERN).fillna(False).astype(bool)
+    integers = pd.to_numeric(text[is_int])
+    floats = pd.to_numeric(text[~is_int], errors='coerce').astype(np.float64)
+    if integers.dtype.kind != 'i':  # Beyond the int64 range
+        floats = pd.concat([floats, integers.astype(np.float64)])
+        integers = integers.iloc[:0]
+    integral = np.isfinite(floats) & (floats == np.trunc(floats)) & (floats.abs() < 2 ** 63)
+    integers = pd.concat([integers.astype(np.int64), floats[integral].astype(np.int64)])
+    return integers, floats[~integral]
+
+def _parse_integers(column: pd.Series) -> pd.Series:
+    """Parse a text column to exact integers, failing on non-integer values"""
+    # Fast paths for a chunk of plain integers, which both parse exactly
+    if pa is not None and isinstance(column.dtype, pd.ArrowDtype):
+        try:
+            return pd.Series(
+                pd.arrays.ArrowExtensionArray(pc.cast(pa.array(column.array), pa.int64())),
+                index=column.index,
+                name=column.name,
+            )
+        except pa.ArrowInvalid:
+            pass
+    else:
+        try:
+            parsed = pd.to_numeric(column)
+        except (ValueError, TypeError):
+            pass
+        else:
+            if parsed.dtype.kind == 'i':
+                return parsed.astype('Int64')
+    integers, others = _split_numbers(column.dropna())
+    if len(others):
+        raise ValueError(f"Column '{column.name}' has non-integer values")
+    result = pd.Series(pd.NA, index=column.index, name=column.name, dtype='Int64')
+    result[integers.index] = integers
+    return result
+
+def _hash_numbers(values: np.ndarray) -> np.ndarray:
+    """Hash numeric IDs, with integral floats hashing as the matching int64"""
+    if values.dtype.kind == 'f':
+        integral = np.isfinite(values) & (values == np.trunc(values)) & (np.abs(values) < 2 ** 63)
+        return np.concatenate([
+            pd.util.hash_array(values[integral].astype(np.int64)),
+            pd.util.hash_array(values[~integral]),
+        ])
+    return pd.util.hash_array(values.astype(np.int64))
+
+def _hash_ids(ids: pd.Series) -> np.ndarray:
+    """
+    Hash non-missing IDs to uint64 so they can be deduplicated as flat arrays
+
+    Numeric IDs hash by value whether they were parsed as integers, widened
+    to float by missing values, or read as text, so "1", "01" and "1.0"
+    match. Other IDs hash as their text.
+    """
+    ids = ids.dropna()
+    if ids.dtype.kind in 'iufb':
+        return _hash_numbers(ids.to_numpy())
+    if pa is not None and isinstance(ids.dtype, pd.ArrowDtype):
+        try:
+            # Fast path for the common case of a chunk of plain integer IDs
+            return _hash_numbers(pc.cast(pa.array(ids.array), pa.int64()).to_numpy())
+        except pa.ArrowInvalid:
+            pass
+    integers, floats = _split_numbers(ids)
+    texts = ids[floats.index[floats.isna()]]
+    return np.concatenate([
+        pd.util.hash_array(integers.to_numpy()),
+        pd.util.hash_array(floats.dropna().to_numpy()),
+        pd.util.hash_array(texts.to_numpy(dtype=object)),
+    ])
+
+def _check_chunk(chunk: pd.DataFrame) -> tuple:
+    """
+    Compute the partial validation counts for one chunk
+    
+    Returns:
+        (rows, cells, missing cells, hashes of the non-missing IDs)
+    """
+    # Missing IDs are skipped since they are already counted as missing cells
+    id_hashes = _hash_ids(chunk['id']) if 'id' in chunk.columns else np.empty(0, dtype=np.uint64)
+    return len(chunk), chunk.size, _count_missing(chunk), id_hashes
+
 @timing_decorator
-def validate_data(file_path: str) -> bool:
-    """Validate CSV data integrity with comprehensive checks"""
+def validate_data(
+    file_path: str,
+    columns: Optional[List[str]] = None,
+    dtype_hints: Optional[Dict[str, str]] = None,
+) -> bool:
+    """
+    Validate CSV data integrity with comprehensive checks
+    
+    Args:
+        file_path: Path to the CSV file
+        columns: Columns to read and check; other columns are not parsed.
+            Defaults to all columns; an empty list raises ValueError.
+        dtype_hints: Column name to one of the DTYPE_HINTS names ('string',
+            'int64' or 'float64'), applied while parsing instead of
+            inferring the type; missing values are allowed for all of them
+        
+    Returns:
+        True if the data is valid; exits with status 1 otherwise
+    """
+    # PyArrow reads every column for an empty list and pandas none of them
+    if columns is not None and not columns:
+        raise ValueError("columns must name at least one column")
+    dtype_hints = dtype_hints or {}
+    unsupported = sorted(set(dtype_hints.values()) - set(DTYPE_HINTS))
+    if unsupported:
+        raise ValueError(
+            f"Unsupported dtype hints {unsupported}; expected one of {sorted(DTYPE_HINTS)}"
+        )
+    
     try:
         log_activity(f"Starting validation for {file_path}")
-        df = pd.read_csv(file_path)
+        
+        total_rows = 0
+        total_cells = 0
+        missing_cells = 0
+        id_hashes = []
+        
+        # Stream the file in chunks instead of materializing the whole frame;
+        # only 8 bytes of hashed ID per row are kept across chunks
+        for chunk in _iter_chunks(file_path, columns, dtype_hints):
+            rows, cells, missing, chunk_hashes = _check_chunk(chunk)
+            total_rows += rows
+            total_cells += cells
+            missing_cells += missing
+            id_hashes.append(chunk_hashes)
+        
+        # Duplicates are the IDs beyond the first occurrence of each value;
+        # equal hashes are adjacent once sorted
+        all_hashes = np.concatenate(id_hashes) if id_hashes else np.empty(0, dtype=np.uint64)
+        del id_hashes
+        all_hashes.sort()
+        duplicates = int(np.count_nonzero(all_hashes[1:] == all_hashes[:-1]))
         
         # Basic validation
-        if df.empty:
+        if total_rows == 0:
             raise ValueError("Data file is empty")
         
-        log_activity(f"Loaded {len(df)} rows from {file_path}")
+        log_activity(f"Loaded {total_rows} rows from {file_path}")
         
-        # Check missing values - FIXED: Calculate across all cells
-        total_cells = len(df) * len(df.columns)
-        missing_cells = df.isnull().sum().sum()
+        # Check missing values across all cells
         missing_percentage = missing_cells / total_cells if total_cells > 0 else 0
         
         log_activity(f"Missing data percentage: {missing_percentage:.2%}")
@@ -21,11 +272,8 @@ def validate_data(file_path: str) -> bool:
         if missing_percentage > 0.1:  # 10% threshold
             raise ValueError(f"Too many missing values: {missing_percentage:.2%}")
         
-        # Check for duplicate IDs if ID column exists
-        if 'id' in df.columns:
-            duplicates = df['id'].duplicated().sum()
-            if duplicates > 0:
-                log_activity(f"Warning: Found {duplicates} duplicate IDs", "WARNING")
+        if duplicates > 0:
+            log_activity(f"Warning: Found {duplicates} duplicate IDs", "WARNING")
         
         log_activity("Data validation passed")
         return True
@@ -1,3 +1,38 @@
+import functools
+import logging
+import time
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Runs of the characters str.split() treats as whitespace, spelled out so the
+# Python and Arrow (RE2) regex engines agree on them
+_WS_PATTERN = '[\t-\r\x1c- \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+'
+
+def log_activity(message: str, level: str = "INFO") -> None:
+    """
+    Log a pipeline activity message
+    
+    Args:
+        message: Message to log
+        level: Logging level name, e.g. "INFO", "WARNING" or "ERROR"
+    """
+    logger.log(getattr(logging, level.upper(), logging.INFO), message)
+
+def timing_decorator(func):
+    """Log how long each call to the decorated function takes at DEBUG level"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # Nothing is formatted unless DEBUG logging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s took %.3f ms", func.__name__, (time.perf_counter_ns() - start) / 1e6)
+    return wrapper
+
 def clean_text(text: str, preserve_case: bool = False) -> str:
     """
     Clean and normalize text data
@@ -12,17 +47,41 @@ def clean_text(text: str, preserve_case: bool = False) -> str:
     if not text:
         return ""
     
-    # Replace newlines with spaces
-    cleaned = re.sub(r'\n+', ' ', text)
-    
-    # Replace multiple spaces with single space
-    cleaned = re.sub(r'\s+', ' ', cleaned)
-    
-    # Strip leading/trailing whitespace
-    cleaned = cleaned.strip()
+    # Collapse whitespace runs (including newlines) to single spaces and
+    # strip the ends in one pass
+    cleaned = ' '.join(text.split())
     
     # Convert to lowercase only if not preserving case
     if not preserve_case:
         cleaned = cleaned.lower()
     
     return cleaned
+
+def clean_text_series(texts: pd.Series, preserve_case: bool = False) -> pd.Series:
+    """
+    Clean and normalize a Series of text the way clean_text does per value
+    
+    Arrow-backed strings (the default str dtype in pandas 3) are lowercased
+    by Arrow, which maps each character on its own; str.lower handles a few
+    context-dependent cases differently, e.g. 'ΣΑΣ' gives 'σασ' rather than
+    'σας' and 'İ' gives 'i' rather than 'i̇'. Object Series match clean_text.
+    
+    Args:
+        texts: Series of text values to clean; missing values become "" and
+            other non-string values in object Series are converted with str()
+        preserve_case: If True, preserve original capitalization
+        
+    Returns:
+        Series of cleaned text strings
+    """
+    texts = texts.fillna('')
+    if texts.dtype == object:
+        # Stay on object dtype so the str methods keep Python semantics
+        texts = texts.astype(str).astype(object)
+    
+    cleaned = texts.str.replace(_WS_PATTERN, ' ', regex=True).str.strip(' ')
+    
+    if not preserve_case:
+        cleaned = cleaned.str.lower()
+    
+    return cleaned
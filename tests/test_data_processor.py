@@ -1,16 +1,18 @@
 import pytest
 import pandas as pd
 import os
-import sys
 from unittest.mock import patch, mock_open
 import tempfile
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from data_processor import validate_data, process_data, generate_report
 from utils import load_config, format_currency, validate_email
 
+_MISSING_THRESHOLD_CASES = (
+    (0.05, True),   # 5% missing - should pass
+    (0.15, False),  # 15% missing - should fail
+    (0.20, False),  # 20% missing - should fail
+)
+
 class TestDataProcessor:
     
     @pytest.fixture
@@ -65,11 +67,9 @@ class TestDataProcessor:
         with pytest.raises(SystemExit):
             validate_data('nonexistent_file.csv')
     
-    @pytest.mark.parametrize("missing_percentage,should_pass", [
-        (0.05, True),   # 5% missing - should pass
-        (0.15, False),  # 15% missing - should fail
-        (0.20, False),  # 20% missing - should fail
-    ])
+    @pytest.mark.parametrize("missing_percentage,should_pass", _MISSING_THRESHOLD_CASES, ids=(
+        "missing_5pct", "missing_15pct", "missing_20pct",
+    ))
     def test_validate_missing_data_threshold(self, missing_percentage, should_pass):
         """Test validation with different missing data percentages"""
         # Create data with specified missing percentage
@@ -1,13 +1,9 @@
 import pytest
 import pandas as pd
-import sys
 import os
 from unittest.mock import patch
 import tempfile
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from data_processor import validate_data, process_data, generate_report
 
 class TestEdgeCases:
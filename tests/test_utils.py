@@ -1,20 +1,88 @@
-@pytest.mark.parametrize("input_text,expected", [
+import logging
+
+import pandas as pd
+import pytest
+
+from utils import clean_text, clean_text_series, timing_decorator
+
+_CLEAN_TEXT_CASES = (
     ('  Hello World  ', 'hello world'),  # Updated expectation
-    ('Text\nWith\nNewlines', 'text with newlines'),  # Updated expectation  
+    ('Text\nWith\nNewlines', 'text with newlines'),  # Updated expectation
     ('Multiple   Spaces', 'multiple spaces'),  # Updated expectation
     ('UPPERCASE', 'uppercase'),
     ('MiXeD cAsE', 'mixed case'),
     ('', ''),
-])
-def test_clean_text(self, input_text, expected):
-    """Test text cleaning functionality"""
-    result = clean_text(input_text)
-    assert result == expected
-
-def test_clean_text_preserve_case(self):
-    """Test text cleaning with case preservation"""
-    result = clean_text('  Hello World  ', preserve_case=True)
-    assert result == 'Hello World'
-    
-    result = clean_text('Text\nWith\nNewlines', preserve_case=True)
-    assert result == 'Text With Newlines'
+)
+
+_SERIES_TEXTS = [
+    '  Hello World  ', 'Text\nWith\nNewlines', 'Multiple \t  Spaces', 'UPPERCASE',
+    'MiXeD cAsE', '', None, ' wide\u3000space\x1c', '\x85Ünïcödé\u2028 ',
+]
+
+_PRESERVE_CASE_CASES = (False, True)
+
+_TIMING_LEVEL_CASES = (
+    (logging.DEBUG, 1),
+    (logging.INFO, 0),
+)
+
+@pytest.fixture(params=["object", "string", "arrow"])
+def text_dtype(request):
+    """Object, pandas string and Arrow-backed string dtypes for the Series cleaner"""
+    if request.param == "arrow":
+        pa = pytest.importorskip("pyarrow")
+        return pd.ArrowDtype(pa.string())
+    return request.param
+
+class TestTextUtils:
+
+    @pytest.mark.parametrize("input_text,expected", _CLEAN_TEXT_CASES, ids=(
+        "padded", "newlines", "multi_space", "upper", "mixed", "empty",
+    ))
+    def test_clean_text(self, input_text, expected):
+        """Test text cleaning functionality"""
+        result = clean_text(input_text)
+        assert result == expected
+
+    def test_clean_text_preserve_case(self):
+        """Test text cleaning with case preservation"""
+        result = clean_text('  Hello World  ', preserve_case=True)
+        assert result == 'Hello World'
+
+        result = clean_text('Text\nWith\nNewlines', preserve_case=True)
+        assert result == 'Text With Newlines'
+
+    @pytest.mark.parametrize("preserve_case", _PRESERVE_CASE_CASES, ids=("lower", "preserve"))
+    def test_clean_text_series_matches_clean_text(self, text_dtype, preserve_case):
+        """Test the Series cleaner matches clean_text for each dtype"""
+        texts = pd.Series(_SERIES_TEXTS, dtype=text_dtype)
+
+        result = clean_text_series(texts, preserve_case=preserve_case)
+
+        assert list(result) == [clean_text(t, preserve_case) for t in _SERIES_TEXTS]
+
+    def test_clean_text_series_object_lowercase(self):
+        """Test object Series use Python's context-dependent lowercasing"""
+        texts = ['ΣΑΣ', 'İSTANBUL']
+
+        result = clean_text_series(pd.Series(texts, dtype=object))
+
+        assert list(result) == [clean_text(t) for t in texts]
+
+    def test_clean_text_series_non_string_values(self):
+        """Test non-string values in object Series are cleaned as strings"""
+        result = clean_text_series(pd.Series([' A ', 5, 2.5, None], dtype=object))
+
+        assert list(result) == ['a', '5', '2.5', '']
+
+class TestTimingDecorator:
+
+    @pytest.mark.parametrize("level,expected", _TIMING_LEVEL_CASES, ids=("debug", "info"))
+    def test_logs_duration_only_at_debug(self, caplog, level, expected):
+        """Test call durations are logged only when DEBUG logging is enabled"""
+        timed = timing_decorator(lambda: "done")
+
+        with caplog.at_level(level, logger="utils"):
+            assert timed() == "done"
+
+        assert len([r for r in caplog.records if " took " in r.getMessage()]) == expected
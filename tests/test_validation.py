@@ -0,0 +1,192 @@
+import logging
+
+import pytest
+
+import data_processor
+from data_processor import validate_data
+
+@pytest.fixture(params=["pyarrow", "pandas"])
+def backend(request, monkeypatch):
+    """Run a test against the PyArrow reader and the pandas C engine fallback"""
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(data_processor, "pa_csv", None)
+    return request.param
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Split even tiny files into several chunks on both backends"""
+    monkeypatch.setattr(data_processor, "CHUNK_SIZE", 2)
+    monkeypatch.setattr(data_processor, "ARROW_BLOCK_SIZE", 16)
+
+_DTYPE_HINT_CASES = (
+    ('int64', '', True),
+    ('int64', '1.0', True),
+    ('int64', '1.5', False),
+    ('int64', 'inf', False),
+    ('int64', 'abc', False),
+    ('float64', '', True),
+    ('float64', '1.5', True),
+    ('float64', 'abc', False),
+    ('string', 'abc', True),
+)
+
+_UNREAD_HINT_CASES = (
+    (["value"], "id"),
+    (None, "missing"),
+)
+
+_UNSUPPORTED_HINTS = ("object", "category", "int32")
+
+def write_csv(tmp_path, text, name="data.csv", encoding="utf-8"):
+    """Write CSV text to a temporary file and return its path"""
+    path = tmp_path / name
+    path.write_text(text, encoding=encoding)
+    return str(path)
+
+def duplicate_warnings(caplog):
+    """Return the duplicate-ID warnings logged during the test"""
+    return [r.getMessage() for r in caplog.records if "duplicate IDs" in r.getMessage()]
+
+class TestValidateData:
+
+    def test_duplicates_across_chunk_boundary(self, backend, small_chunks, tmp_path, caplog):
+        """Test duplicate IDs are counted within and across chunks"""
+        path = write_csv(tmp_path, "id,value\n1,10\n2,20\n3,30\n1,40\n4,50\n2,60\n2,70\n")
+
+        with caplog.at_level(logging.WARNING):
+            assert validate_data(path) is True
+
+        assert duplicate_warnings(caplog) == ["Warning: Found 3 duplicate IDs"]
+
+    def test_missing_ids_are_not_duplicates(self, backend, small_chunks, tmp_path, caplog):
+        """Test missing IDs count as missing cells, not as duplicate IDs"""
+        rows = "".join(f"{i},{i * 10}\n" for i in range(1, 19))
+        path = write_csv(tmp_path, "id,value\n" + rows + ",190\n,200\n")
+
+        with caplog.at_level(logging.WARNING):
+            assert validate_data(path) is True
+
+        assert duplicate_warnings(caplog) == []
+
+    def test_ids_compare_by_parsed_value(self, backend, tmp_path, caplog):
+        """Test both backends parse IDs the same way before comparing"""
+        path = write_csv(tmp_path, "id,value\n1,10\n2,20\n1,30\n01,40\n")
+
+        with caplog.at_level(logging.WARNING):
+            assert validate_data(path) is True
+
+        assert duplicate_warnings(caplog) == ["Warning: Found 2 duplicate IDs"]
+
+    def test_integer_ids_match_across_missing_values(self, backend, small_chunks, tmp_path, caplog):
+        """Test integer IDs match when missing values widen a chunk to float"""
+        rows = "".join(f"{i},{i * 10}\n" for i in range(1, 19))
+        path = write_csv(tmp_path, "id,value\n" + rows + ",190\n5,200\n")
+
+        with caplog.at_level(logging.WARNING):
+            assert validate_data(path) is True
+
+        assert duplicate_warnings(caplog) == ["Warning: Found 1 duplicate IDs"]
+
+    def test_text_ids_after_numeric_chunks(self, backend, small_chunks, tmp_path, caplog):
+        """Test text IDs after the first chunk neither fail nor hide numeric duplicates"""
+        rows = "".join(f"{i},{i * 10}\n" for i in range(1, 19))
+        path = write_csv(tmp_path, "id,value\n" + rows + "A7,190\n07,200\nA7,210\n")
+
+        with caplog.at_level(logging.WARNING):
+            assert validate_data(path) is True
+
+        assert duplicate_warnings(caplog) == ["Warning: Found 2 duplicate IDs"]
+
+    def test_utf8_bom_header(self, backend, tmp_path, caplog):
+        """Test a UTF-8 byte order mark does not hide the ID column"""
+        path = write_csv(tmp_path, "id,value\n1,10\n1,20\n", encoding="utf-8-sig")
+
+        with caplog.at_level(logging.WARNING):
+            assert validate_data(path) is True
+
+        assert duplicate_warnings(caplog) == ["Warning: Found 1 duplicate IDs"]
+
+    def test_too_many_missing_values(self, backend, small_chunks, tmp_path):
+        """Test the missing-value threshold applies across all chunks"""
+        path = write_csv(tmp_path, "id,value\n1,10\n2,\n3,30\n4,\n5,50\n")
+
+        with pytest.raises(SystemExit):
+            validate_data(path)
+
+    def test_na_tokens_count_as_missing(self, backend, tmp_path):
+        """Test both backends read pandas' default NA tokens as missing"""
+        path = write_csv(tmp_path, "id,value\n1,None\n2,<NA>\n3,None\n")
+
+        with pytest.raises(SystemExit):
+            validate_data(path)
+
+    def test_columns_restrict_missing_ratio(self, backend, tmp_path):
+        """Test only the selected columns count toward the missing ratio"""
+        path = write_csv(tmp_path, "id,value,notes\n1,10,\n2,20,\n3,30,\n")
+
+        with pytest.raises(SystemExit):
+            validate_data(path)
+
+        assert validate_data(path, columns=["id", "value"]) is True
+
+    def test_unknown_column_fails(self, backend, tmp_path):
+        """Test selecting a column the file does not have fails validation"""
+        path = write_csv(tmp_path, "id,value\n1,10\n2,20\n")
+
+        with pytest.raises(SystemExit):
+            validate_data(path, columns=["id", "missing"])
+
+    def test_empty_columns_rejected(self, backend, tmp_path):
+        """Test an empty column selection is rejected up front"""
+        path = write_csv(tmp_path, "id,value\n1,10\n")
+
+        with pytest.raises(ValueError, match="columns must name at least one column"):
+            validate_data(path, columns=[])
+
+    def test_header_only_file(self, backend, tmp_path):
+        """Test a file with a header but no rows fails validation"""
+        path = write_csv(tmp_path, "id,value\n")
+
+        with pytest.raises(SystemExit):
+            validate_data(path)
+
+    @pytest.mark.parametrize("hint,value,should_pass", _DTYPE_HINT_CASES, ids=(
+        "int_missing", "int_integral_float", "int_fraction", "int_inf", "int_text",
+        "float_missing", "float_fraction", "float_text", "string_text",
+    ))
+    def test_dtype_hints(self, backend, tmp_path, hint, value, should_pass):
+        """Test a dtype hint passes or fails the same way on both backends"""
+        rows = "".join(f"{i},{i * 10}\n" for i in range(1, 11))
+        path = write_csv(tmp_path, f"id,value\n{value},0\n" + rows)
+
+        if should_pass:
+            assert validate_data(path, dtype_hints={"id": hint}) is True
+        else:
+            with pytest.raises(SystemExit):
+                validate_data(path, dtype_hints={"id": hint})
+
+    def test_int64_hint_is_exact(self, backend, tmp_path, caplog):
+        """Test int64-hinted IDs beyond float64 precision stay distinct"""
+        path = write_csv(tmp_path, f"id,value\n{2 ** 53 + 1},10\n{2 ** 53},20\n1.0,30\n")
+
+        with caplog.at_level(logging.WARNING):
+            assert validate_data(path, dtype_hints={"id": "int64"}) is True
+
+        assert duplicate_warnings(caplog) == []
+
+    @pytest.mark.parametrize("columns,hinted", _UNREAD_HINT_CASES, ids=("excluded", "absent"))
+    def test_hints_for_unread_columns_are_ignored(self, backend, tmp_path, columns, hinted):
+        """Test hints for columns outside columns= or the file are ignored"""
+        path = write_csv(tmp_path, "id,value\n1,10\n2,20\n")
+
+        assert validate_data(path, columns=columns, dtype_hints={hinted: "int64"}) is True
+
+    @pytest.mark.parametrize("hint", _UNSUPPORTED_HINTS, ids=("object", "category", "int32"))
+    def test_unsupported_dtype_hint(self, backend, tmp_path, hint):
+        """Test dtype hints outside DTYPE_HINTS are rejected up front"""
+        path = write_csv(tmp_path, "id,value\n1,10\n")
+
+        with pytest.raises(ValueError, match="Unsupported dtype hints"):
+            validate_data(path, dtype_hints={"id": hint})